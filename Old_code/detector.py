@@ -5,7 +5,12 @@ Supports Picamera2 on Raspberry Pi when `config.IS_RASPBERRY_PI` is True.
 """
 import cv2
 import os
+import queue
+import threading
+import numpy as np
 import config
+from scrfd import SCRFD
+from ort_session import CUDA_PROVIDERS, create_session
 
 try:
     if config.IS_RASPBERRY_PI:
@@ -16,28 +21,78 @@ except Exception:
     Picamera2 = None
 
 
+def _opencl_gpu():
+    """True when OpenCV's default OpenCL device is a GPU (not a CPU runtime)."""
+    gpu = getattr(cv2.ocl, "Device_TYPE_GPU", 4)   # CL_DEVICE_TYPE_GPU
+    try:
+        return bool(cv2.ocl.Device.getDefault().type() & gpu)
+    except cv2.error:
+        return False
+
+
+def mask_facing(lms):
+    """
+    Frontal-face test for all detections at once (same yaw/pitch rule as `main.mask_facing`).
+    
+    Args:
+        lms: (K,5,2) SCRFD landmarks -> left eye, right eye, nose, left mouth, right mouth
+    
+    Returns:
+        np.ndarray: (K,) bool mask of faces looking at the camera
+    """
+    eye_mid = (lms[:,0] + lms[:,1]) * 0.5
+    nose = lms[:,2]
+
+    nose_offset = np.abs(nose[:,0] - eye_mid[:,0])
+    eye_dist = np.abs(lms[:,0,0] - lms[:,1,0])
+    yaw_ratio = np.divide(nose_offset, eye_dist,
+                          out=np.ones_like(eye_dist), where=eye_dist > 0)
+
+    mouth_mid_y = (lms[:,3,1] + lms[:,4,1]) * 0.5
+    pitch_ratio = np.abs(nose[:,1] - eye_mid[:,1]) / (mouth_mid_y - eye_mid[:,1] + 1e-6)
+
+    return (yaw_ratio < 0.25) & (pitch_ratio < 0.7)
+
+
 class FaceDetector:
     """
-    Detects frontal faces in video frames using Haar Cascade.
+    Detects faces in video frames using SCRFD (ONNX).
     
     Attributes:
-        face_cascade: OpenCV Haar cascade classifier
+        detector: SCRFD wrapper around a persistent ONNX Runtime session
         cap: Video capture object (webcam)
     """
     
-    def __init__(self, cascade_path):
+    def __init__(self, model_path, detect_interval=1):
         """
         Initialize the face detector.
         
         Args:
-            cascade_path (str): Path to Haar cascade XML file
+            model_path (str): Path to SCRFD ONNX model
+            detect_interval (int): While faces are present, run SCRFD only on
+                every Nth frame and reuse the last boxes in between
         
         Raises:
-            RuntimeError: If cascade file cannot be loaded or camera cannot be opened
+            RuntimeError: If model file cannot be loaded or camera cannot be opened
         """
-        self.face_cascade = cv2.CascadeClassifier(cascade_path)
-        if self.face_cascade.empty():
-            raise RuntimeError(f"Could not load cascade from {cascade_path}")
+        if not os.path.exists(model_path):
+            raise RuntimeError(f"Could not load SCRFD model from {model_path}")
+
+        det_sess = create_session(model_path, CUDA_PROVIDERS)
+        self.detector = SCRFD(det_sess)
+        self.detect_interval = detect_interval
+        self._last_faces = []
+        self._frames_since_detect = 0
+        self._fps_ema = 0.0
+
+        # With OpenCL-enabled OpenCV and a real GPU, shrink frames to the SCRFD input
+        # size on the GPU; CPU-only OpenCL runtimes would just add a UMat round trip
+        self.use_opencl = cv2.ocl.haveOpenCL() and _opencl_gpu()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+
+        # Warm up once so session/kernel initialisation doesn't land on the first real frame
+        self.detector.detect(np.zeros((640, 640, 3), np.uint8), 0.6)
         
         # If configured for Raspberry Pi and Picamera2 is available, use it for capture
         self.use_picamera = False
@@ -45,7 +100,7 @@ class FaceDetector:
         if Picamera2 is not None:
             try:
                 self.picam2 = Picamera2()
-                config_preview = self.picam2.create_preview_configuration(main={"format": "XRGB8888", "size": (640, 480)})
+                config_preview = self.picam2.create_preview_configuration(main={"format": "BGR888", "size": (640, 480)})
                 self.picam2.configure(config_preview)
                 self.picam2.start()
                 self.use_picamera = True
@@ -57,19 +112,58 @@ class FaceDetector:
             self.cap = cv2.VideoCapture(0)
             if not self.cap.isOpened():
                 raise RuntimeError("Could not open video device 0. Try a different camera index.")
+
+        # Capture runs on a daemon thread so camera readout overlaps with inference.
+        # The 1-slot queue always holds the newest frame; stale ones are dropped.
+        self._q = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+        self._reader.start()
+    
+    def _reader_loop(self):
+        """Continuously grab frames into the queue until stopped or capture fails."""
+        try:
+            while not self._stop.is_set():
+                item = self._grab_frame()
+                self._put_latest(item)
+                if not item[0]:
+                    break
+        finally:
+            # however the thread ends (even if a read raised), unblock read_frame()
+            self._put_latest((False, None))
+    
+    def _put_latest(self, item):
+        """Put `item` in the 1-slot queue, dropping the stale frame it replaces."""
+        try:
+            self._q.put_nowait(item)
+        except queue.Full:
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                pass
+            self._q.put_nowait(item)
     
     def read_frame(self):
         """
-        Read a frame from the camera.
+        Read the most recent frame from the capture thread.
+        
+        Returns:
+            tuple: (success, frame) where frame is BGR image array or None on failure
+        """
+        return self._q.get()
+    
+    def _grab_frame(self):
+        """
+        Read a frame directly from the camera (blocking).
         
         Returns:
             tuple: (success, frame) where frame is BGR image array or None on failure
         """
         if self.use_picamera and self.picam2 is not None:
             try:
+                # Picamera2's BGR888 yields [R, G, B] bytes per pixel: the same order the
+                # old XRGB8888 + cvtColor(RGB2BGR) path produced, without the per-frame pass
                 frame = self.picam2.capture_array()
-                # Picamera2 returns RGB-like arrays; convert to BGR for OpenCV
-                frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
                 return True, frame
             except Exception:
                 return False, None
@@ -83,8 +177,13 @@ class FaceDetector:
         """
         Detect frontal faces in a frame.
         
-        Note: This detector ONLY finds frontal faces (looking at camera).
-        Side profiles or angles are not detected.
+        Note: SCRFD also finds side profiles and turned-away heads; those are
+        dropped with the 5-point yaw/pitch test, so only faces looking at the
+        camera are returned.
+        
+        When faces were found on the last detection, the cached boxes are
+        returned for `detect_interval - 1` frames; with no faces in view
+        every frame is searched so new arrivals are picked up immediately.
         
         Args:
             frame: BGR image (from cv2.read())
@@ -92,33 +191,53 @@ class FaceDetector:
         Returns:
             list: [(x, y, w, h), ...] bounding boxes of detected faces
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,      # Image pyramid scale
-            minNeighbors=5,       # Minimum neighbors for detection
-            minSize=(60, 60)      # Minimum face size
-        )
-        return faces
+        if self._last_faces and self._frames_since_detect < self.detect_interval - 1:
+            self._frames_since_detect += 1
+            return self._last_faces
+
+        scale = 1.0
+        if self.use_opencl:
+            # Full-resolution resize runs on the iGPU; SCRFD then sees an
+            # image already at its input size and only letterboxes it
+            h, w = frame.shape[:2]
+            scale = self.detector.input_size / max(h, w)
+            # INTER_LINEAR like SCRFD's own letterbox resize, so results match the CPU path
+            frame = cv2.resize(cv2.UMat(frame), (int(w * scale), int(h * scale)),
+                               interpolation=cv2.INTER_LINEAR).get()
+
+        boxes, landmarks = self.detector.detect(frame, 0.6)
+        if len(boxes):
+            boxes = [b for b, ok in zip(boxes, mask_facing(landmarks)) if ok]
+        # On the OpenCL path SCRFD's boxes are already int in downscaled pixels, so
+        # scaling them back up loses ~1/scale px (about 2px at 640x480). That only
+        # moves the cached boxes/centres the tracker sees; nothing here draws them.
+        self._last_faces = [(int(x1 / scale), int(y1 / scale),
+                             int((x2 - x1) / scale), int((y2 - y1) / scale))
+                            for (x1, y1, x2, y2) in boxes]
+        self._frames_since_detect = 0
+        return self._last_faces
     
     def get_fps(self, dt):
         """
-        Calculate frames per second.
+        Calculate frames per second, smoothed with an exponential moving average.
         
         Args:
             dt (float): Time delta since last frame (in seconds)
         
         Returns:
-            float: FPS (returns 0 if dt is 0)
+            float: Smoothed FPS (the last value if dt is 0)
         """
-        return 1 / dt if dt > 0 else 0
+        if dt > 0:
+            fps = 1 / dt
+            self._fps_ema = 0.9 * self._fps_ema + 0.1 * fps if self._fps_ema else fps
+        return self._fps_ema
     
     def build_detections(self, faces):
         """
         Build detection dictionaries with centroid information.
         
         Args:
-            faces: Array of (x, y, w, h) tuples from face_cascade.detectMultiScale()
+            faces: List of (x, y, w, h) tuples from detect_faces()
         
         Returns:
             list: [{rect, center, face_id}, ...] with centroids calculated
@@ -135,7 +254,13 @@ class FaceDetector:
         return detections
     
     def release(self):
-        """Release camera and close windows."""
+        """Stop the capture thread, release camera and close windows."""
+        self._stop.set()
+        self._reader.join(timeout=1.0)
+        # Never release the camera under a read still running on the reader thread
+        if self._reader.is_alive():
+            cv2.destroyAllWindows()
+            return
         try:
             if self.use_picamera and self.picam2 is not None:
                 try:
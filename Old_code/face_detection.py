@@ -26,10 +26,10 @@ def main():
     
     # Setup paths
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    cascade_path = os.path.join(script_dir,"Models", "haarcascade_frontalface_default.xml")
+    model_path = os.path.join(script_dir, "Models", "scrfd_500m_bnkps.onnx")
     
     # Initialize detector and tracker    
-    detector = FaceDetector(cascade_path)
+    detector = FaceDetector(model_path, detect_interval=3)
     tracker = FaceTracker()
     # Initialize audio player using campaign name (preferred) or AUDIO_FILE fallback
     audio_path = ""
@@ -46,15 +46,15 @@ def main():
     audio = AudioPlayer(audio_path)
     
     print("✓ Camera initialized")
-    print("✓ Haar cascade loaded (frontal faces only)")
+    print("✓ SCRFD face detector loaded")
     print("✓ Face tracker ready")
     print("-" * 60)
     print("Press 'Q' to exit and print final report.")
     print("-" * 60)
     
     # Track campaign start and end times
-    campaign_start_time = time.time()
-    prev_time = 0
+    campaign_start_ns = time.monotonic_ns()
+    prev_ns = 0
     
     try:
         while True:
@@ -65,10 +65,11 @@ def main():
                 break
             
             # Get timing info
-            curr_time = time.time()
-            dt = curr_time - prev_time if prev_time != 0 else 0
+            curr_ns = time.monotonic_ns()
+            dt = (curr_ns - prev_ns) * 1e-9 if prev_ns else 0
             fps = detector.get_fps(dt)
-            prev_time = curr_time
+            prev_ns = curr_ns
+            curr_time = curr_ns * 1e-9
             
             # Detect faces in current frame
             faces = detector.detect_faces(frame)
@@ -80,7 +81,7 @@ def main():
             curr_detections = tracker.update(curr_detections, curr_time, dt)
 
             # Audio management: play/loop while any faces are tracked
-            num_tracked = len(tracker.face_tracking)
+            num_tracked = tracker.num_tracked
             audio.manage(num_tracked)
 
             # Visualization & Output
@@ -93,8 +94,7 @@ def main():
         print("\n[!] Interrupted by user")
     finally:
         # Calculate campaign duration
-        campaign_end_time = time.time()
-        campaign_duration = campaign_end_time - campaign_start_time
+        campaign_duration = (time.monotonic_ns() - campaign_start_ns) * 1e-9
         
         # stop audio and release resources
         try:
@@ -127,12 +127,12 @@ def _visualize_debug(frame, curr_detections, tracker, fps):
         cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
         
         # Draw label with ID and attention time
-        attn_time = tracker.face_tracking[face_id]["attention_time"]
+        attn_time = tracker.get_attention_time(face_id)
         label = f"ID:{face_id} Attn:{attn_time:.1f}s"
         cv2.putText(frame, label, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
     
     # Display FPS and tracked count
-    num_tracked = len(tracker.face_tracking)
+    num_tracked = tracker.num_tracked
     cv2.putText(
         frame,
         f"FPS: {int(fps)} | Tracked: {num_tracked}",
@@ -167,7 +167,7 @@ def _print_headless(fps, faces, tracker):
     pprint({
         "FPS": round(fps, 2),
         "faces_detected": len(faces),
-        "faces_tracked": len(tracker.face_tracking),
+        "faces_tracked": tracker.num_tracked,
         "attention_mapping": summary
     })
 
@@ -1,6 +1,7 @@
 import cv2
 import time
 import numpy as np
+from scipy.optimize import linear_sum_assignment
 from ultralytics import YOLO  # Using YOLOv8 for human detection
 import pandas as pd
 
@@ -8,6 +9,24 @@ import pandas as pd
 face_cascade = cv2.CascadeClassifier(r"D:\Project\Human_proximity_sensor\haarcascade_frontalface_default.xml")
 yolo_model = YOLO(r"D:\Project\Human_proximity_sensor\yolov8n.pt")  # Load YOLOv8 model
 
+
+def match_faces(face_tracking, xy, thr=50):
+    """Map (M,2) face corners to tracked IDs by optimal (Hungarian) assignment within thr px, else None."""
+    matched = [None] * len(xy)
+    if not face_tracking or not len(xy):
+        return matched
+    ids = list(face_tracking)
+    prev_xy = np.array(list(face_tracking.values()), np.float32)
+    cost = np.linalg.norm(prev_xy[:, None, :] - xy[None, :, :], axis=-1)  # (N,M)
+    # Out-of-range pairs get a prohibitive cost so stale positions can't steal a valid match
+    cost[cost >= thr] = 1e9
+    rows, cols = linear_sum_assignment(cost)
+    for r, c in zip(rows, cols):
+        if cost[r, c] < thr:
+            matched[c] = ids[r]
+    return matched
+
+
 # Initialize tracking variables
 trigger_count = 0
 face_look_time = {}
@@ -32,6 +51,7 @@ out = None  # Initialize VideoWriter as None
 start_time = time.time()
 Frame_count = 0
 face_records = []
+gray_buf = None  # reused grayscale frame buffer
 
 while cap.isOpened():
     ret, frame = cap.read()
@@ -54,10 +74,16 @@ while cap.isOpened():
         out = cv2.VideoWriter(video_name, fourcc, fps, (new_width, new_height))
 
     frame = cv2.resize(frame, (new_width, new_height))
+
+    # Grayscale once per frame, then detect faces at half resolution
+    if gray_buf is None or gray_buf.shape != frame.shape[:2]:
+        gray_buf = np.empty(frame.shape[:2], np.uint8)
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray_buf)
+    small_gray = cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+
     results = yolo_model(frame)  # Run YOLO detection
     
     for result in results:
-        print("Frame count",Frame_count)
         Frame_count += 1
         Time_in_video = round(Frame_count/fps,2)
         for box in result.boxes.data:
@@ -67,7 +93,6 @@ while cap.isOpened():
                 distance = (width / 2) / (x2 - x1) * 2  # Approximate distance
                 person_box_height = int(y2 - y1)
                 person_box_width = int(x2 - x1)
-                print(f"Time: {(Time_in_video)} s","person box height",person_box_height,"  Width",person_box_width)
 
                 
                 if person_box_height > 200 or person_box_width > 70:  # If within 2 meters
@@ -77,22 +102,16 @@ while cap.isOpened():
                     cv2.putText(frame, f"ALERT: Human in Proximity! {Time_in_video}", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
                     cv2.rectangle(frame, (int(x1), int(y1)), (int(x2), int(y2)), (0, 255, 0), 2)  # Draw bounding box on human
                     
-                    # Crop the detected human region for face detection
-                    human_crop = frame[int(y1):int(y2), int(x1):int(x2)]
-                    gray_crop = cv2.cvtColor(human_crop, cv2.COLOR_BGR2GRAY)
-                    faces = face_cascade.detectMultiScale(gray_crop, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+                    # Crop the detected human region (half-res gray) for face detection
+                    gray_crop = small_gray[int(y1) // 2:int(y2) // 2, int(x1) // 2:int(x2) // 2]
+                    faces = face_cascade.detectMultiScale(gray_crop, scaleFactor=1.2, minNeighbors=4, minSize=(15, 15),
+                                                          flags=cv2.CASCADE_SCALE_IMAGE)
+                    # back to full-res, adjusted to original frame coordinates
+                    faces = [(2 * x + int(x1), 2 * y + int(y1), 2 * w, 2 * h) for (x, y, w, h) in faces]
+                    face_xy = np.array([(x, y) for (x, y, _, _) in faces], np.float32).reshape(-1, 2)
                     
                     detected_faces = []
-                    for (x, y, w, h) in faces:
-                        x += int(x1)  # Adjust coordinates to original frame
-                        y += int(y1)
-                        face_id = None
-                        for prev_face in face_tracking:
-                            prev_x, prev_y = face_tracking[prev_face]
-                            if abs(prev_x - x) < 50 and abs(prev_y - y) < 50:
-                                face_id = prev_face  # Re-map face
-                                break
-                        
+                    for (x, y, w, h), face_id in zip(faces, match_faces(face_tracking, face_xy)):
                         if face_id is None:
                             face_id = f"face_{len(face_tracking)}"
                             face_tracking[face_id] = (x, y)
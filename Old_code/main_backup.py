@@ -1,88 +1,158 @@
 import cv2
+import os
 import time
 import numpy as np
 import onnxruntime as ort
 from scrfd import SCRFD
+from tracker import FaceTracker
+from ort_session import CUDA_PROVIDERS, create_session
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 # ------------------ ArcFace ------------------
 
 class ArcFace:
     def __init__(self, model_path):
-        self.session = ort.InferenceSession(model_path)
-        self.input_name = self.session.get_inputs()[0].name
-
-    def preprocess(self, face):
-        face = cv2.resize(face, (112, 112))
-        face = cv2.cvtColor(face, cv2.COLOR_BGR2RGB)
-        face = face.astype(np.float32)
-        face = (face / 255.0 - 0.5) / 0.5
-        return np.expand_dims(face, axis=0)
-
-    def get_embedding(self, face):
-        blob = self.preprocess(face)
-        emb = self.session.run(None, {self.input_name: blob})[0]
-        emb = emb.flatten()
-        emb = emb / np.linalg.norm(emb)
-        return emb
+        self.session = create_session(model_path, CUDA_PROVIDERS)
+
+        inp = self.session.get_inputs()[0]
+        self.input_name = inp.name
+        # FP16 models (see convert_models.py) take float16 input
+        self.input_dtype = np.float16 if inp.type == "tensor(float16)" else np.float32
+        # Some ArcFace exports take NHWC (N,112,112,3), others NCHW (N,3,112,112)
+        self.nchw = inp.shape[1] == 3
+        # uint8 -> (x/255 - 0.5)/0.5 for all 256 values, in the model's input dtype
+        self._lut = (np.arange(256, dtype=np.float32) / 127.5 - 1.0).astype(self.input_dtype)
+        self._crop_buf = np.empty((0, 112, 112, 3), np.uint8)
+
+        # On CUDA, keep input/output tensors resident on the GPU across frames
+        self._binding = None
+        self._input_ort = None
+        if "CUDAExecutionProvider" in self.session.get_providers():
+            self._binding = self.session.io_binding()
+            self._binding.bind_output(self.session.get_outputs()[0].name, "cuda")
+
+    def preprocess(self, faces):
+        n = len(faces)
+        if len(self._crop_buf) < n:
+            self._crop_buf = np.empty((n, 112, 112, 3), np.uint8)
+        crops = self._crop_buf[:n]
+        for i, face in enumerate(faces):
+            cv2.resize(face, (112, 112), dst=crops[i])
+
+        if self.nchw:
+            # (x/255 - 0.5)/0.5 == (x - 127.5)/127.5; BGR->RGB, normalize and NCHW in one pass
+            batch = cv2.dnn.blobFromImages(list(crops), 1.0 / 127.5, (112, 112),
+                                           (127.5, 127.5, 127.5), swapRB=True)
+            return batch.astype(self.input_dtype, copy=False)
+
+        # NHWC: BGR->RGB as a reversed-stride view, then normalise with one table lookup
+        return self._lut[crops[..., ::-1]]
+
+    def _run(self, blob):
+        if self._binding is None:
+            return self.session.run(None, {self.input_name: blob})[0]
+
+        blob = np.ascontiguousarray(blob)
+        if self._input_ort is None or self._input_ort.shape() != list(blob.shape):
+            # (re)allocate the device buffer only when the batch size changes
+            self._input_ort = ort.OrtValue.ortvalue_from_numpy(blob, "cuda", 0)
+            self._binding.bind_ortvalue_input(self.input_name, self._input_ort)
+        else:
+            self._input_ort.update_inplace(blob)
+        self.session.run_with_iobinding(self._binding)
+        return self._binding.copy_outputs_to_cpu()[0]
+
+    def get_embeddings(self, faces):
+        blob = self.preprocess(faces)
+        embs = self._run(blob)
+        embs = embs.reshape(len(faces), -1).astype(np.float32, copy=False)
+
+        # L2-normalize rows in place: one einsum for the squared norms, no temporaries
+        norms = np.einsum("ij,ij->i", embs, embs)
+        np.sqrt(norms, out=norms)
+        np.divide(embs, norms[:, None], out=embs)
+        return embs
 
 # ------------------ Face Memory ------------------
 
 class FaceMemory:
-    def __init__(self, similarity_thresh=0.45):
-        self.db = {}          # id -> embedding
+    def __init__(self, similarity_thresh=0.45, dim=512, capacity=64):
+        self.emb_matrix = np.empty((capacity, dim), np.float32)  # row i -> ids[i]
+        self.ids = []
         self.last_seen = {}  # id -> timestamp
         self.next_id = 1
         self.thresh = similarity_thresh
 
-    def cosine(self, a, b):
-        return np.dot(a, b)
+    def _add(self, fid, emb):
+        n = len(self.ids)
+        if n == len(self.emb_matrix):
+            grown = np.empty((2 * n, self.emb_matrix.shape[1]), np.float32)
+            grown[:n] = self.emb_matrix
+            self.emb_matrix = grown
+        self.emb_matrix[n] = emb
+        self.ids.append(fid)
 
     def get_id(self, emb):
-        best_id = None
-        best_sim = 0
-
-        for fid, stored_emb in self.db.items():
-            sim = self.cosine(emb, stored_emb)
-            if sim > best_sim:
-                best_sim = sim
-                best_id = fid
-
-        if best_sim > self.thresh:
-            self.last_seen[best_id] = time.time()
-            return best_id
+        n = len(self.ids)
+        if n:
+            # embeddings are L2-normalised, so one GEMV gives all cosine sims
+            sims = self.emb_matrix[:n] @ emb
+            idx = int(sims.argmax())
+            if sims[idx] > self.thresh:
+                best_id = self.ids[idx]
+                self.last_seen[best_id] = time.time()
+                return best_id
 
         # new face
         fid = self.next_id
-        self.db[fid] = emb
+        self._add(fid, emb)
         self.last_seen[fid] = time.time()
         self.next_id += 1
         return fid
 
 # ------------------ Head Pose Filter ------------------
 
+@njit(cache=True)
 def is_facing_camera(landmarks):
-    le, re, nose, lm, rm = landmarks
+    # landmarks: (5,2) float32 -> left eye, right eye, nose, left mouth, right mouth
 
     # horizontal symmetry (yaw)
-    eye_mid_x = (le[0] + re[0]) / 2
-    nose_offset = abs(nose[0] - eye_mid_x)
+    eye_mid_x = (landmarks[0, 0] + landmarks[1, 0]) / 2
+    nose_offset = abs(landmarks[2, 0] - eye_mid_x)
 
-    eye_dist = abs(le[0] - re[0])
+    eye_dist = abs(landmarks[0, 0] - landmarks[1, 0])
+    if eye_dist == 0:
+        return False   # degenerate landmarks; under numba a zero division would raise
     yaw_ratio = nose_offset / eye_dist
 
     # vertical symmetry (pitch)
-    eye_mid_y = (le[1] + re[1]) / 2
-    mouth_mid_y = (lm[1] + rm[1]) / 2
-    pitch_ratio = abs(nose[1] - eye_mid_y) / (mouth_mid_y - eye_mid_y)
+    eye_mid_y = (landmarks[0, 1] + landmarks[1, 1]) / 2
+    mouth_mid_y = (landmarks[3, 1] + landmarks[4, 1]) / 2
+    pitch_ratio = abs(landmarks[2, 1] - eye_mid_y) / (mouth_mid_y - eye_mid_y + 1e-6)
 
     return yaw_ratio < 0.25 and pitch_ratio < 0.7 and eye_dist < 40 #For more strict frontal face, use pitch_ratio < 0.7 and eye_dist < 30
 
 
-det_sess = ort.InferenceSession("Models/scrfd_500m_bnkps.onnx")
+# compile once at import instead of on the first detected face
+is_facing_camera(np.array([[30, 40], [60, 40], [45, 55], [35, 70], [55, 70]], np.float32))
+
+
+det_sess = create_session("Models/scrfd_500m_bnkps.onnx", CUDA_PROVIDERS)
 detector = SCRFD(det_sess)
 
-arcface = ArcFace("Models/arcface.onnx")
+arcface_path = "Models/arcface_fp16.onnx"
+if not os.path.exists(arcface_path):
+    arcface_path = "Models/arcface.onnx"
+arcface = ArcFace(arcface_path)
 memory = FaceMemory()
+tracker = FaceTracker()
+identities = {}   # tracker face_id -> FaceMemory id
 
 cap = cv2.VideoCapture(0)
 
@@ -90,45 +160,66 @@ prev_time = time.time()
 
 # ------------------ Main Loop ------------------
 frame_count = 0
-face_id = None
 while True:
     ret, frame = cap.read()
     if not ret:
         break
 
+    # FPS
+    curr = time.time()
+    dt = curr - prev_time
+    fps = 1 / dt if dt > 0 else 0
+    prev_time = curr
+
     boxes, landmarks = detector.detect(frame, 0.6)
 
+    detections = []
     for (x1, y1, x2, y2), lm in zip(boxes, landmarks):
-
         if not is_facing_camera(lm):
             continue
-
-        # Run ArcFace only every 10 frames
-        if frame_count % 10 == 0 or face_id is None:
-            face_crop = frame[y1:y2, x1:x2]
-            if face_crop.size == 0:
-                continue
-            emb = arcface.get_embedding(face_crop)
-            face_id = memory.get_id(emb)
-            
-
-        # Draw
-        cv2.rectangle(frame, (x1, y1), (x2, y2), (0,255,0), 2)
-
-        for (lx, ly) in lm.astype(int):
-            cv2.circle(frame, (lx, ly), 2, (0,0,255), -1)
-        cv2.putText(frame, f"ID: {face_id}",
+        if frame[y1:y2, x1:x2].size == 0:
+            continue
+        detections.append({
+            "rect": (x1, y1, x2 - x1, y2 - y1),
+            "center": ((x1 + x2) / 2, (y1 + y2) / 2),
+            "face_id": None,
+            "box": (x1, y1, x2, y2),
+            "landmarks": lm
+        })
+
+    detections = tracker.update(detections, curr, dt)
+
+    # Forget identities of tracks the tracker has dropped (tracker IDs never repeat)
+    if len(identities) > tracker.n_active:
+        active = set(tracker.ids[:tracker.n_active].tolist())
+        identities = {tid: fid for tid, fid in identities.items() if tid in active}
+
+    # Run ArcFace only for tracks without an identity yet, one batched call
+    new = [d for d in detections if d["face_id"] not in identities]
+    if new:
+        crops = [frame[y1:y2, x1:x2] for (x1, y1, x2, y2) in (d["box"] for d in new)]
+        for d, emb in zip(new, arcface.get_embeddings(crops)):
+            identities[d["face_id"]] = memory.get_id(emb)
+
+    # Draw: all boxes and all landmarks with one polylines call each
+    if detections:
+        corners = [[(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+                   for (x1, y1, x2, y2) in (d["box"] for d in detections)]
+        cv2.polylines(frame, list(np.array(corners, np.int32)), True, (0,255,0), 2)
+
+        # every landmark is a closed 1-point polyline, i.e. a filled dot of radius 2
+        pts = np.concatenate([d["landmarks"] for d in detections]).astype(np.int32)
+        cv2.polylines(frame, list(pts.reshape(-1, 1, 2)), True, (0,0,255), 4)
+
+    for d in detections:
+        x1, y1 = d["box"][:2]
+        cv2.putText(frame, f"ID: {identities[d['face_id']]}",
                     (x1, y1 - 10),
                     cv2.FONT_HERSHEY_SIMPLEX,
                     0.7,
                     (0,255,0),
                     2)
 
-    # FPS
-    curr = time.time()
-    fps = 1 / (curr - prev_time)
-    prev_time = curr
-
     cv2.putText(frame, f"FPS: {int(fps)}",
                 (20, 40),
                 cv2.FONT_HERSHEY_SIMPLEX,
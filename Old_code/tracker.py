@@ -3,24 +3,52 @@ Face Tracking Module
 Handles face ID assignment, remapping, and attention span tracking.
 """
 
+from collections import ChainMap
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
 import config
 
 
 class FaceTracker:
     """
-    Tracks faces across frames using greedy nearest-neighbor assignment.
+    Tracks faces across frames using optimal (Hungarian) centroid assignment.
+    
+    Active faces are stored as parallel NumPy arrays (one row per face) so
+    per-frame updates are a handful of vectorized ops instead of dict lookups.
     
     Attributes:
-        face_tracking (dict): Maps face_id -> {center, attention_time, total_time, last_seen}
-        face_history (dict): Maps face_id -> {center, attention_time, total_time} (all faces ever seen)
+        ids (ndarray): (K,) int32 face IDs, rows [0, n_active) are live
+        centers (ndarray): (K, 2) float32 last known face centers
+        attention_time (ndarray): (K,) float64 seconds looking at camera
+        total_time (ndarray): (K,) float64 seconds on screen
+        last_seen (ndarray): (K,) float64 timestamp of last detection
+        n_active (int): Number of currently tracked faces
+        face_history (dict): Maps face_id -> {center, attention_time, total_time} (faces that went stale)
         next_face_id (int): Counter for generating unique face IDs
     """
     
-    def __init__(self):
-        self.face_tracking = {}      # Currently active faces
-        self.face_history = {}       # All faces ever tracked (including stale ones)
+    def __init__(self, capacity=16):
+        self.ids = np.zeros(capacity, np.int32)
+        self.centers = np.zeros((capacity, 2), np.float32)
+        self.attention_time = np.zeros(capacity, np.float64)
+        self.total_time = np.zeros(capacity, np.float64)
+        self.last_seen = np.zeros(capacity, np.float64)
+        self.n_active = 0
+        self._row = {}               # face_id -> row index into the arrays
+        self.face_history = {}       # All faces that went stale
         self.next_face_id = 1
     
+    @property
+    def num_tracked(self):
+        """Number of currently tracked faces."""
+        return self.n_active
+    
+    def get_attention_time(self, face_id):
+        """Attention time (seconds) of an active face."""
+        return float(self.attention_time[self._row[face_id]])
+    
     def update(self, curr_detections, curr_time, dt):
         """
         Update face tracking with current detections.
@@ -34,10 +62,10 @@ class FaceTracker:
             list: Updated curr_detections with assigned face_ids
         """
         # Step 1: Compute all pairwise distances
-        pairs = self._compute_distances(curr_detections)
+        dist, prev_ids = self._compute_distances(curr_detections)
         
-        # Step 2: Greedy nearest-neighbor assignment
-        assignments = self._greedy_assignment(curr_detections, pairs)
+        # Step 2: Globally optimal one-to-one assignment
+        assignments = self._optimal_assignment(curr_detections, dist, prev_ids)
         
         # Step 3: Assign IDs (reuse or create new)
         self._assign_ids(curr_detections, assignments, curr_time)
@@ -55,56 +83,60 @@ class FaceTracker:
         Compute Euclidean distances between all current and previous face centers.
         
         Returns:
-            list: [(distance, curr_idx, prev_id), ...]
-        """
-        pairs = []
-        for i, curr in enumerate(curr_detections):
-            cx, cy = curr["center"]
-            for fid in self.face_tracking:
-                px, py = self.face_tracking[fid]["center"]
-                dist = ((px - cx) ** 2 + (py - cy) ** 2) ** 0.5
-                pairs.append((dist, i, fid))
-        return pairs
+            tuple: (dist, prev_ids) where dist is an (N, M) array with
+                   dist[i, j] = distance from detection i to face prev_ids[j]
+        """
+        n = self.n_active
+        curr = np.array([d["center"] for d in curr_detections], dtype=np.float32).reshape(-1, 2)
+        prev = self.centers[:n]
+        dist = np.sqrt(((curr[:, None] - prev[None, :]) ** 2).sum(-1))
+        return dist, self.ids[:n].tolist()
     
-    def _greedy_assignment(self, curr_detections, pairs):
+    def _optimal_assignment(self, curr_detections, dist, prev_ids):
         """
-        Greedy nearest-neighbor assignment: one-to-one matching.
+        Hungarian assignment on the distance matrix: one-to-one matching
+        that minimises total movement, so crossing faces don't swap IDs.
         
-        Ensures each previous face ID is used at most once per frame,
-        and each current detection matches at most one previous face.
+        Pairs further apart than the per-detection threshold are never matched.
         
         Returns:
             dict: {curr_idx -> face_id}
         """
-        pairs.sort(key=lambda t: t[0])  # Sort by distance (smallest first)
-        assigned_curr = set()
-        assigned_prev = set()
-        assignments = {}
+        if dist.size == 0:
+            return {}
         
-        for dist, i, fid in pairs:
-            # Skip if either face already assigned
-            if i in assigned_curr or fid in assigned_prev:
-                continue
-            
-            # Threshold: allow movement up to 50px or 60% of face size
-            _, _, w, h = curr_detections[i]["rect"]
-            threshold = max(50, max(w, h) * 0.6)
-            
-            if dist <= threshold:
-                assignments[i] = fid
-                assigned_curr.add(i)
-                assigned_prev.add(fid)
+        # Threshold: allow movement up to 50px or 60% of face size
+        thresholds = np.array([max(50, max(d["rect"][2], d["rect"][3]) * 0.6)
+                               for d in curr_detections], dtype=np.float32)
+        cost = dist.copy()
+        cost[dist > thresholds[:, None]] = 1e9
         
-        return assignments
+        rows, cols = linear_sum_assignment(cost)
+        return {int(r): prev_ids[c] for r, c in zip(rows, cols) if cost[r, c] < 1e9}
+    
+    def _add_face(self, face_id, center, curr_time):
+        """Append a new face row, doubling the arrays when full."""
+        n = self.n_active
+        if n == len(self.ids):
+            for name in ("ids", "centers", "attention_time", "total_time", "last_seen"):
+                arr = getattr(self, name)
+                grown = np.zeros((2 * len(arr),) + arr.shape[1:], arr.dtype)
+                grown[:n] = arr[:n]
+                setattr(self, name, grown)
+        
+        self.ids[n] = face_id
+        self.centers[n] = center
+        self.attention_time[n] = 0.0
+        self.total_time[n] = 0.0
+        self.last_seen[n] = curr_time
+        self._row[face_id] = n
+        self.n_active = n + 1
     
     def _assign_ids(self, curr_detections, assignments, curr_time):
         """
         Assign face IDs: reuse matched IDs, create new IDs for unmatched faces.
         """
         for i, curr in enumerate(curr_detections):
-            x, y, w, h = curr["rect"]
-            cx, cy = curr["center"]
-            
             if i in assignments:
                 # Reuse matched ID
                 face_id = assignments[i]
@@ -112,12 +144,7 @@ class FaceTracker:
                 # Create new ID
                 face_id = self.next_face_id
                 self.next_face_id += 1
-                self.face_tracking[face_id] = {
-                    "center": (cx, cy),
-                    "attention_time": 0.0,
-                    "total_time": 0.0,
-                    "last_seen": curr_time
-                }
+                self._add_face(face_id, curr["center"], curr_time)
             
             curr["face_id"] = face_id
     
@@ -125,31 +152,46 @@ class FaceTracker:
         """
         Update tracking info: position, total_time, attention_time.
         """
-        for curr in curr_detections:
-            face_id = curr["face_id"]
-            cx, cy = curr["center"]
-            
-            # self.face_tracking is getting modified here
-            tracked = self.face_tracking[face_id]
-            tracked["center"] = (cx, cy)
-            tracked["last_seen"] = curr_time
-            tracked["total_time"] += dt
-            
-            # Since Haar cascade only detects frontal faces, detected = looking at camera
-            tracked["attention_time"] += dt
+        if not curr_detections:
+            return
+        
+        rows = np.fromiter((self._row[d["face_id"]] for d in curr_detections),
+                           dtype=np.intp, count=len(curr_detections))
+        self.centers[rows] = [d["center"] for d in curr_detections]
+        self.last_seen[rows] = curr_time
+        self.total_time[rows] += dt
+        
+        # detect_faces only returns frontal faces, so detected = looking at camera
+        self.attention_time[rows] += dt
     
     def _cleanup_stale(self, curr_time):
         """
         Remove faces not seen for more than `config.STALE_FACE_TIMEOUT` seconds.
         Also saves them to face_history before deletion.
         """
-        timeout = config.STALE_FACE_TIMEOUT
-        stale = [fid for fid in self.face_tracking 
-                 if curr_time - self.face_tracking[fid].get("last_seen", 0) > timeout]
-        for fid in stale:
-            # Save to history before deletion
-            self.face_history[fid] = self.face_tracking[fid].copy()
-            del self.face_tracking[fid]
+        n = self.n_active
+        stale = curr_time - self.last_seen[:n] > config.STALE_FACE_TIMEOUT
+        if not stale.any():
+            return
+        
+        # Save to history before deletion (gather all stale rows with the mask at once)
+        for fid, center, attn, total in zip(self.ids[:n][stale].tolist(),
+                                            self.centers[:n][stale].tolist(),
+                                            self.attention_time[:n][stale].tolist(),
+                                            self.total_time[:n][stale].tolist()):
+            self.face_history[fid] = {
+                "center": tuple(center),
+                "attention_time": attn,
+                "total_time": total
+            }
+        
+        # Compact live rows to the front
+        keep = ~stale
+        k = int(keep.sum())
+        for arr in (self.ids, self.centers, self.attention_time, self.total_time, self.last_seen):
+            arr[:k] = arr[:n][keep]
+        self.n_active = k
+        self._row = {fid: row for row, fid in enumerate(self.ids[:k].tolist())}
     
     def get_summary(self):
         """
@@ -158,12 +200,13 @@ class FaceTracker:
         Returns:
             dict: {face_id -> {attention_s, total_s}, ...}
         """
+        n = self.n_active
         return {
-            fid: {
-                "attention_s": round(self.face_tracking[fid]["attention_time"], 2),
-                "total_s": round(self.face_tracking[fid]["total_time"], 2)
+            int(fid): {
+                "attention_s": round(float(attn), 2),
+                "total_s": round(float(total), 2)
             }
-            for fid in self.face_tracking
+            for fid, attn, total in zip(self.ids[:n], self.attention_time[:n], self.total_time[:n])
         }
     
     def get_all_faces_history(self):
@@ -171,24 +214,15 @@ class FaceTracker:
         Get ALL faces ever tracked (active + stale).
         Used for final report and CSV export.
         
+        History entries are exposed through a read-only ChainMap view rather
+        than copied, so the cost only scales with the number of active faces.
+        
         Returns:
-            dict: {face_id -> {attention_time, total_time}, ...}
+            Mapping: {face_id -> {attention_time, total_time, ...}, ...}
         """
-        # Combine active faces and history
-        all_faces = {}
-        
-        # Add currently active faces
-        for fid in self.face_tracking:
-            all_faces[fid] = {
-                "attention_time": self.face_tracking[fid]["attention_time"],
-                "total_time": self.face_tracking[fid]["total_time"]
-            }
-        
-        # Add stale faces from history
-        for fid in self.face_history:
-            all_faces[fid] = {
-                "attention_time": self.face_history[fid]["attention_time"],
-                "total_time": self.face_history[fid]["total_time"]
-            }
-        
-        return all_faces
+        n = self.n_active
+        active = {
+            int(fid): {"attention_time": float(attn), "total_time": float(total)}
+            for fid, attn, total in zip(self.ids[:n], self.attention_time[:n], self.total_time[:n])
+        }
+        return ChainMap(active, self.face_history)
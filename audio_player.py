@@ -1,6 +1,9 @@
 """
 Audio playback helper using pygame.
 
+The track is decoded once into an in-memory `pygame.mixer.Sound` and played
+on a reserved mixer channel, so (re)starting playback never touches the disk.
+
 Behavior:
 - Start playing when `num_tracked > 0` and not already playing.
 - When playback remaining time <= `restart_threshold` (seconds),
@@ -22,12 +25,16 @@ class AudioPlayer:
         self._initialized = False
         self._length = None
         self._start_time = None
+        self._sound = None
+        self._channel = None
 
         if self.enabled:
             try:
                 pygame.mixer.init()
-                pygame.mixer.music.load(self.path)
-                self._length = pygame.mixer.Sound(self.path).get_length()
+                pygame.mixer.set_reserved(1)
+                self._sound = pygame.mixer.Sound(self.path)   # decoded PCM, kept in memory
+                self._channel = pygame.mixer.Channel(0)
+                self._length = self._sound.get_length()
                 self._initialized = True
                 print(f"✓ Audio loaded: {self.path}")
             except Exception as e:
@@ -65,7 +72,7 @@ class AudioPlayer:
             return
 
         try:
-            pygame.mixer.music.play()
+            self._channel.play(self._sound)
             self._start_time = time.time()
         except Exception:
             pass
@@ -75,7 +82,7 @@ class AudioPlayer:
             return
 
         try:
-            pygame.mixer.music.stop()
+            self._channel.stop()
         except Exception:
             pass
 
@@ -83,7 +90,7 @@ class AudioPlayer:
         if not self.enabled:
             return False
 
-        return pygame.mixer.music.get_busy()
+        return self._channel.get_busy()
 
     def time_remaining(self):
         """
@@ -0,0 +1,96 @@
+"""
+Offline model conversion helpers.
+
+Run once on a development machine (needs `onnx` and `onnxconverter-common`,
+which are not runtime dependencies):
+
+    python convert_models.py
+
+Converted models are written next to the originals in `Models/`.
+The INT8 ArcFace model is only built when `Models/calibration_faces/`
+contains face crops (~200 images) to calibrate activation ranges with.
+"""
+
+import os
+
+import cv2
+import numpy as np
+import onnx
+from onnxconverter_common import float16
+from onnxruntime.quantization import (CalibrationDataReader, QuantFormat,
+                                      QuantType, quantize_static)
+
+
+def convert_fp16(src, dst, keep_io_types=False):
+    """
+    Convert an FP32 ONNX model to FP16.
+
+    Args:
+        src (str): Path to the FP32 model
+        dst (str): Output path for the FP16 model
+        keep_io_types (bool): Keep FP32 inputs/outputs (casts are inserted in the graph)
+    """
+    model = onnx.load(src)
+    model_fp16 = float16.convert_float_to_float16(model, keep_io_types=keep_io_types)
+    onnx.save(model_fp16, dst)
+    print(f"✓ Saved: {dst}")
+
+
+class FaceCropReader(CalibrationDataReader):
+    """Feeds face crops from a folder to the quantizer, preprocessed like `main.ArcFace`."""
+
+    def __init__(self, model_path, image_dir):
+        model_input = onnx.load(model_path).graph.input[0]
+        self.input_name = model_input.name
+        self.nchw = model_input.type.tensor_type.shape.dim[1].dim_value == 3
+        self.paths = [os.path.join(image_dir, f) for f in sorted(os.listdir(image_dir))
+                      if f.lower().endswith((".jpg", ".jpeg", ".png"))]
+        self._iter = iter(self.paths)
+
+    def get_next(self):
+        for path in self._iter:
+            face = cv2.imread(path)
+            if face is None:
+                continue
+            face = cv2.cvtColor(cv2.resize(face, (112, 112)), cv2.COLOR_BGR2RGB)
+            blob = face.astype(np.float32)[None] / 127.5 - 1.0
+            if self.nchw:
+                blob = np.ascontiguousarray(blob.transpose(0, 3, 1, 2))
+            return {self.input_name: blob}
+        return None
+
+
+def quantize_int8(src, dst, calib_dir):
+    """
+    Statically quantize an FP32 ONNX model to INT8 (per-channel weights, QOperator format).
+
+    Args:
+        src (str): Path to the FP32 model
+        dst (str): Output path for the INT8 model
+        calib_dir (str): Folder of face crops used for calibration
+    """
+    quantize_static(src, dst, FaceCropReader(src, calib_dir),
+                    quant_format=QuantFormat.QOperator,
+                    per_channel=True,
+                    weight_type=QuantType.QInt8,
+                    activation_type=QuantType.QUInt8)
+    print(f"✓ Saved: {dst}")
+
+
+if __name__ == "__main__":
+    models_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Models")
+    # FP32 inputs/outputs are kept so callers feed the same blobs as for the FP32 models
+    convert_fp16(os.path.join(models_dir, "scrfd_500m_bnkps.onnx"),
+                 os.path.join(models_dir, "scrfd_500m_bnkps_fp16.onnx"),
+                 keep_io_types=True)
+    convert_fp16(os.path.join(models_dir, "arcface.onnx"),
+                 os.path.join(models_dir, "arcface_fp16.onnx"),
+                 keep_io_types=True)
+
+    calib_dir = os.path.join(models_dir, "calibration_faces")
+    if os.path.isdir(calib_dir):
+        quantize_int8(os.path.join(models_dir, "arcface.onnx"),
+                      os.path.join(models_dir, "arcface_int8.onnx"),
+                      calib_dir)
+    else:
+        print(f"Skipping INT8 ArcFace: add face crops to {calib_dir} to enable it.")
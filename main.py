@@ -2,38 +2,159 @@ import cv2
 import time
 import os
 import csv
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from datetime import datetime
-import onnxruntime as ort
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MaxNLocator
 import matplotlib.dates as mdates
 
 
 from scrfd import SCRFD
+from ort_session import create_session
 from audio_player import AudioPlayer
 import config
 
 
+# ------------------ Capture ------------------
+
+class LatestFrame:
+    """
+    Single-slot frame buffer filled by a background capture thread.
+
+    The camera keeps reading while the main thread runs inference; frames
+    the main loop didn't get to in time are simply overwritten.
+    """
+
+    def __init__(self, read_fn):
+        self._read = read_fn            # () -> (ok, frame)
+        self._cond = threading.Condition()
+        self._frame = None
+        self._seq = 0                   # incremented for every new frame
+        self._taken = 0                 # seq of the last frame handed out
+        self._ok = True
+        self._error = None              # exception raised by read_fn, re-raised by get()
+        self.stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        try:
+            while not self.stop_event.is_set():
+                ok, frame = self._read()
+                if not ok:
+                    return
+                if frame is None:
+                    continue
+                with self._cond:
+                    self._frame = frame
+                    self._seq += 1
+                    self._cond.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            # however capture ends, wake get() so the main loop can't block forever
+            with self._cond:
+                self._ok = False
+                self._cond.notify_all()
+
+    def get(self):
+        """Block until a frame newer than the last one returned arrives; None once capture ends."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq != self._taken
+                                or not self._ok or self.stop_event.is_set())
+            if self._seq == self._taken:
+                if self._error is not None:
+                    raise self._error
+                return None
+            self._taken = self._seq
+            return self._frame
+
+    def stop(self):
+        """Stop capturing; True once the thread has exited and the camera can be released."""
+        self.stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        return not self._thread.is_alive()
+
+
+# ------------------ Timeline ------------------
+
+TIMELINE_DTYPE = np.dtype([("t", "<f4"), ("n", "<u4")])
+MAX_PLOT_POINTS = 2000
+
+
+class TimelineLog:
+    """
+    People-count samples (seconds since start, count) appended to a binary file.
+
+    Records are packed in memory and written in batches, so RAM stays flat
+    however long the campaign runs.
+    """
+
+    RECORD = struct.Struct("<fI")
+
+    def __init__(self, path, flush_every=500):
+        self.path = path
+        self.flush_every = flush_every
+        self._buf = []
+        self._f = open(path, "wb")
+
+    def append(self, elapsed, count):
+        self._buf.append(self.RECORD.pack(elapsed, count))
+        if len(self._buf) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self._f.write(b"".join(self._buf))
+        self._buf.clear()
+
+    def close(self):
+        self.flush()
+        self._f.close()
+
+
 # ------------------ ArcFace ------------------
 
 class ArcFace:
     def __init__(self, model_path):
-        self.session = ort.InferenceSession(model_path)
-        self.input_name = self.session.get_inputs()[0].name
-
-    def preprocess(self, face):
-        face = cv2.resize(face, (112, 112))
-        face = cv2.cvtColor(face, cv2.COLOR_BGR2RGB)
-        face = face.astype(np.float32)
-        face = (face / 255.0 - 0.5) / 0.5
-        return np.expand_dims(face, axis=0)
-
-    def get_embedding(self, face):
-        blob = self.preprocess(face)
+        self.session = create_session(model_path)
+        inp = self.session.get_inputs()[0]
+        self.input_name = inp.name
+        # Some ArcFace exports take NHWC (N,112,112,3), others NCHW (N,3,112,112)
+        self.nchw = inp.shape[1] == 3
+        input_dtype = np.float16 if inp.type == "tensor(float16)" else np.float32
+        # uint8 -> (x/255 - 0.5)/0.5 for all 256 values, in the model's input dtype
+        self._lut = (np.arange(256, dtype=np.float32) / 127.5 - 1.0).astype(input_dtype)
+        self._crop_buf = np.empty((0, 112, 112, 3), np.uint8)
+
+    def preprocess(self, faces):
+        n = len(faces)
+        if len(self._crop_buf) < n:
+            self._crop_buf = np.empty((n, 112, 112, 3), np.uint8)
+        crops = self._crop_buf[:n]
+        for i, face in enumerate(faces):
+            cv2.resize(face, (112, 112), dst=crops[i])
+        # BGR->RGB as a reversed-stride view, then normalise with one table lookup
+        batch = self._lut[crops[..., ::-1]]
+        if self.nchw:
+            batch = np.ascontiguousarray(batch.transpose(0, 3, 1, 2))
+        return batch
+
+    def get_embeddings(self, faces):
+        """Embed a list of BGR face crops with one session.run -> (N, D) unit vectors."""
+        blob = self.preprocess(faces)
         emb = self.session.run(None, {self.input_name: blob})[0]
-        emb = emb.flatten()
-        emb = emb / np.linalg.norm(emb)
+        emb = emb.reshape(len(faces), -1).astype(np.float32, copy=False)
+        # row-wise L2 normalise: one einsum for the squared norms, one in-place multiply
+        inv = np.einsum("ij,ij->i", emb, emb)
+        np.sqrt(inv, out=inv)
+        np.reciprocal(inv, out=inv)
+        emb *= inv[:, None]
         return emb
 
 
@@ -41,47 +162,118 @@ class ArcFace:
 
 class FaceMemory:
     def __init__(self, similarity_thresh=0.6):
-        self.db = {}
+        self.db_mat = None      # (capacity, D) float32, row i -> ids[i]
+        self.ids = []
         self.next_id = 1
         self.thresh = similarity_thresh
 
-    def cosine(self, a, b):
-        return np.dot(a, b)
-
-    def get_id(self, emb):
-        best_id = None
-        best_sim = -1
-
-        for fid, stored_emb in self.db.items():
-            sim = self.cosine(emb, stored_emb)
-            if sim > best_sim:
-                best_sim = sim
-                best_id = fid
-
-        if best_sim >= self.thresh:
-            return best_id
+    def _add(self, emb):
+        n = len(self.ids)
+        if self.db_mat is None:
+            self.db_mat = np.empty((64, emb.shape[0]), np.float32)
+        elif n == len(self.db_mat):
+            # geometric growth keeps inserts amortised O(1)
+            grown = np.empty((2 * n, self.db_mat.shape[1]), np.float32)
+            grown[:n] = self.db_mat
+            self.db_mat = grown
+        self.db_mat[n] = emb
 
         fid = self.next_id
-        self.db[fid] = emb
+        self.ids.append(fid)
         self.next_id += 1
         return fid
 
+    def get_ids(self, embs):
+        """Match (N, D) unit embeddings against all known faces with one GEMM."""
+        n = len(self.ids)
+        if n:
+            sims = embs @ self.db_mat[:n].T
+            best = sims.argmax(axis=1)
+
+        fids = []
+        for i, emb in enumerate(embs):
+            if n and sims[i, best[i]] >= self.thresh:
+                fids.append(self.ids[best[i]])
+            else:
+                fids.append(self._add(emb))
+        return fids
 
-# ------------------ Head Pose ------------------
-
-def is_facing_camera(landmarks):
-    le, re, nose, lm, rm = landmarks
-
-    eye_mid_x = (le[0] + re[0]) / 2
-    nose_offset = abs(nose[0] - eye_mid_x)
-    eye_dist = abs(le[0] - re[0])
-    yaw_ratio = nose_offset / eye_dist if eye_dist > 0 else 1
 
-    eye_mid_y = (le[1] + re[1]) / 2
-    mouth_mid_y = (lm[1] + rm[1]) / 2
-    pitch_ratio = abs(nose[1] - eye_mid_y) / (mouth_mid_y - eye_mid_y + 1e-6)
+# ------------------ Head Pose ------------------
 
-    return yaw_ratio < 0.25 and pitch_ratio < 0.7
+def mask_facing(lms):
+    """
+    Frontal-face test for all detections at once.
+
+    lms: (K,5,2) landmarks -> left eye, right eye, nose, left mouth, right mouth.
+    Returns a (K,) bool mask of faces looking at the camera.
+    """
+    eye_mid = (lms[:,0] + lms[:,1]) * 0.5
+    nose = lms[:,2]
+
+    nose_offset = np.abs(nose[:,0] - eye_mid[:,0])
+    eye_dist = np.abs(lms[:,0,0] - lms[:,1,0])
+    yaw_ratio = np.divide(nose_offset, eye_dist,
+                          out=np.ones_like(eye_dist), where=eye_dist > 0)
+
+    mouth_mid_y = (lms[:,3,1] + lms[:,4,1]) * 0.5
+    pitch_ratio = np.abs(nose[:,1] - eye_mid[:,1]) / (mouth_mid_y - eye_mid[:,1] + 1e-6)
+
+    return (yaw_ratio < 0.25) & (pitch_ratio < 0.7)
+
+
+# ------------------ Detection Gating ------------------
+
+DETECT_EVERY = 5        # while faces are static, run SCRFD on every Nth frame only
+STATIC_SHIFT_PX = 10    # max centre shift between detections to count as static
+IOU_REUSE = 0.5         # overlap with a box from the last pass that keeps its ID
+
+
+def box_iou(a, b):
+    """IoU of every (M,4) box in `a` against every (N,4) box in `b` -> (M,N)."""
+    a = a[:, None, :]
+    w = np.minimum(a[..., 2], b[:, 2]) - np.maximum(a[..., 0], b[:, 0])
+    h = np.minimum(a[..., 3], b[:, 3]) - np.maximum(a[..., 1], b[:, 1])
+    inter = np.clip(w, 0, None) * np.clip(h, 0, None)
+    area_a = (a[..., 2] - a[..., 0]) * (a[..., 3] - a[..., 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / (area_a + area_b - inter + 1e-6)
+
+
+def match_by_iou(iou, thr):
+    """
+    One-to-one matching on an (M,N) IoU matrix, best overlap first.
+    Returns, per row, the matched column or None when nothing above `thr` is left.
+    """
+    matched = [None] * iou.shape[0]
+    used = set()
+    for flat in np.argsort(iou, axis=None)[::-1]:
+        i, j = divmod(int(flat), iou.shape[1])
+        if iou[i, j] <= thr:
+            break
+        if matched[i] is None and j not in used:
+            matched[i] = j
+            used.add(j)
+    return matched
+
+
+def faces_static(prev, curr):
+    """
+    True when `curr` found the same faces as `prev` and none moved by
+    more than STATIC_SHIFT_PX. Both are [((x1, y1, x2, y2), fid), ...].
+    """
+    if not curr or len(prev) != len(curr):
+        return False
+    prev_boxes = {fid: box for box, fid in prev}
+    for (x1, y1, x2, y2), fid in curr:
+        box = prev_boxes.get(fid)
+        if box is None:
+            return False
+        dx = (x1 + x2 - box[0] - box[2]) * 0.5
+        dy = (y1 + y2 - box[1] - box[3]) * 0.5
+        if abs(dx) > STATIC_SHIFT_PX or abs(dy) > STATIC_SHIFT_PX:
+            return False
+    return True
 
 
 # ------------------ MAIN ------------------
@@ -91,22 +283,28 @@ def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
     campaign_start_dt = datetime.now()
+    campaign_start_ns = time.monotonic_ns()   # monotonic: immune to wall-clock jumps
     print(f"✓ Campaign started at: {campaign_start_dt.strftime('%H:%M:%S')}")
 
-    det_sess = ort.InferenceSession(
-        os.path.join(script_dir, "Models/scrfd_500m_bnkps.onnx")
-    )
+    # FP16 SCRFD from convert_models.py when available, FP32 otherwise
+    scrfd_path = os.path.join(script_dir, "Models/scrfd_500m_bnkps_fp16.onnx")
+    if not os.path.exists(scrfd_path):
+        scrfd_path = os.path.join(script_dir, "Models/scrfd_500m_bnkps.onnx")
+    det_sess = create_session(scrfd_path)
     detector = SCRFD(det_sess)
 
-    arcface = ArcFace(os.path.join(script_dir, "Models/arcface.onnx"))
+    # INT8 then FP16 models from convert_models.py when available, FP32 otherwise
+    for name in ("arcface_int8.onnx", "arcface_fp16.onnx", "arcface.onnx"):
+        arcface_path = os.path.join(script_dir, "Models", name)
+        if os.path.exists(arcface_path):
+            break
+    arcface = ArcFace(arcface_path)
     memory = FaceMemory()
 
     face_tracking = {}
+    last_seen = OrderedDict()   # fid -> last seen time, least recently seen first
     session_records = []   # store ALL sessions separately
 
-    timeline = []
-    time_axis = []
-
     campaign_name = getattr(config, "Campaign_name", None)
     audio_path = ""
     if campaign_name:
@@ -123,41 +321,102 @@ def main():
             )
         )
         picam2.start()
+        grabber = LatestFrame(lambda: (True, picam2.capture_array()))
     else:
         cap = cv2.VideoCapture(0)
-
-    prev_time = time.time()
+        # MJPG keeps 640x480@30 within USB bandwidth (raw YUYV often caps lower);
+        # a 1-frame driver buffer means read() never hands back a stale frame
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_FPS, 30)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        grabber = LatestFrame(cap.read)
+
+    prev_ns = time.monotonic_ns()
+    fps = 0.0
+
+    frame_count = 0
+    prev_faces = []     # [(box, fid)] from the last SCRFD pass, doubles as last_boxes for IoU reuse
+    static = False
+
+    # SCRFD runs one frame ahead on a worker thread (ORT releases the GIL), so
+    # detection of frame N+1 overlaps ArcFace, tracking and display of frame N
+    detect_pool = ThreadPoolExecutor(max_workers=1)
+
+    # Opened right before the try so the finally below always closes and removes it
+    results_dir = os.path.join(script_dir, "Human_proximity_Results")
+    os.makedirs(results_dir, exist_ok=True)
+    timeline = TimelineLog(os.path.join(
+        results_dir, f"timeline_{campaign_start_dt.strftime('%Y%m%d_%H%M%S')}.bin"))
 
     try:
-        while True:
-
-            if config.IS_RASPBERRY_PI:
-                frame = picam2.capture_array()
-                if frame is None:
-                    continue
+        frame = grabber.get()
+        pending = detect_pool.submit(detector.detect, frame, 0.6) if frame is not None else None
+
+        while frame is not None:
+
+            curr_ns = time.monotonic_ns()
+            dt = (curr_ns - prev_ns) * 1e-9
+            prev_ns = curr_ns
+            curr_time = curr_ns * 1e-9   # monotonic seconds for stale-face timeouts
+            if dt > 0:
+                # EMA keeps the displayed FPS from jittering frame to frame
+                fps = 0.9*fps + 0.1/dt if fps else 1/dt
+
+            # Camera wait overlaps SCRFD on the current frame
+            next_frame = grabber.get()
+            detection = pending.result() if pending is not None else None
+
+            # Static faces: reuse the last boxes and IDs, skipping SCRFD and ArcFace.
+            # With no faces in view every frame is searched so arrivals are caught.
+            pending = None
+            if next_frame is not None and not (
+                    prev_faces and static and (frame_count + 1) % DETECT_EVERY):
+                pending = detect_pool.submit(detector.detect, next_frame, 0.6)
+
+            if detection is None:
+                tracked = prev_faces
             else:
-                ret, frame = cap.read()
-                if not ret:
-                    break
+                boxes, landmarks = detection
 
-            curr_time = time.time()
-            dt = curr_time - prev_time
-            prev_time = curr_time
-            fps = 1/dt if dt > 0 else 0
+                # Head-pose filter for every detection in one vectorized pass
+                frontal = []
+                if len(boxes):
+                    frontal = [b for b, ok in zip(boxes, mask_facing(landmarks)) if ok]
 
-            boxes, landmarks = detector.detect(frame, 0.6)
+                faces = []
+                for (x1, y1, x2, y2) in frontal:
 
-            for (x1, y1, x2, y2), lm in zip(boxes, landmarks):
+                    face_crop = frame[y1:y2, x1:x2]
+                    if face_crop.size == 0:
+                        continue
 
-                if not is_facing_camera(lm):
-                    continue
+                    faces.append(((x1, y1, x2, y2), face_crop))
 
-                face_crop = frame[y1:y2, x1:x2]
-                if face_crop.size == 0:
-                    continue
+                # Faces overlapping a box from the last pass keep its ID (each ID at most once)
+                fids = [None] * len(faces)
+                if faces and prev_faces:
+                    iou = box_iou(np.array([box for box, _ in faces], np.float32),
+                                  np.array([box for box, _ in prev_faces], np.float32))
+                    for i, j in enumerate(match_by_iou(iou, IOU_REUSE)):
+                        if j is not None:
+                            fids[i] = prev_faces[j][1]
+
+                # One batched ArcFace run and one similarity GEMM for the rest
+                new = [i for i, fid in enumerate(fids) if fid is None]
+                if new:
+                    embs = arcface.get_embeddings([faces[i][1] for i in new])
+                    for i, fid in zip(new, memory.get_ids(embs)):
+                        fids[i] = fid
+
+                tracked = [(box, fid) for (box, _), fid in zip(faces, fids)]
+                static = faces_static(prev_faces, tracked)
+                prev_faces = tracked
 
-                emb = arcface.get_embedding(face_crop)
-                fid = memory.get_id(emb)
+            frame_count += 1
+
+            for (x1, y1, x2, y2), fid in tracked:
 
                 now_clock = datetime.now()
 
@@ -166,11 +425,11 @@ def main():
                         "attention_time": 0.0,
                         "total_time": 0.0,
                         "start_clock": now_clock,
-                        "end_clock": now_clock,
-                        "last_seen": curr_time
+                        "end_clock": now_clock
                     }
 
-                face_tracking[fid]["last_seen"] = curr_time
+                last_seen[fid] = curr_time
+                last_seen.move_to_end(fid)
                 face_tracking[fid]["end_clock"] = now_clock
                 face_tracking[fid]["total_time"] += dt
                 face_tracking[fid]["attention_time"] += dt
@@ -181,11 +440,12 @@ def main():
                     cv2.putText(frame,label,(x1,y1-10),
                                 cv2.FONT_HERSHEY_SIMPLEX,0.5,(0,255,0),1)
 
-            stale = [fid for fid in face_tracking
-                    if curr_time - face_tracking[fid]["last_seen"]
-                    > config.STALE_FACE_TIMEOUT]
-
-            for fid in stale:
+            # Oldest entries are at the front: pop only the ones that timed out
+            while last_seen:
+                fid, seen = next(iter(last_seen.items()))
+                if curr_time - seen <= config.STALE_FACE_TIMEOUT:
+                    break
+                last_seen.popitem(last=False)
                 session_records.append({
                     "Face_ID": fid,
                     "Start_Time": face_tracking[fid]["start_clock"],
@@ -197,8 +457,7 @@ def main():
 
             audio.manage(len(face_tracking))
 
-            timeline.append(len(face_tracking))
-            time_axis.append(datetime.now())
+            timeline.append((curr_ns - campaign_start_ns) * 1e-9, len(face_tracking))
 
             if config.DEBUG:
                 cv2.putText(frame,f"FPS:{int(fps)}",
@@ -207,17 +466,24 @@ def main():
                 cv2.imshow("SCRFD ArcFace Attention",frame)
                 if cv2.waitKey(1)&0xFF==ord('q'):
                     raise KeyboardInterrupt
-                print(f"FPS: {fps:.1f} | Detected: {len(boxes)} | Tracked: {len(face_tracking)}")
+                if (frame_count & 31) == 0:   # stats every 32 frames keep stdout off the hot path
+                    print(f"FPS: {fps:.1f} | Faces: {len(tracked)} | Tracked: {len(face_tracking)}")
+
+            frame = next_frame
 
 
     except KeyboardInterrupt:
         print("\nStopped")
 
     finally:
-        if config.IS_RASPBERRY_PI:
-            picam2.stop()
-        else:
-            cap.release()
+        detect_pool.shutdown()
+        # Never release the camera under a read still running on the capture thread
+        if grabber.stop():
+            if config.IS_RASPBERRY_PI:
+                picam2.stop()
+            else:
+                cap.release()
+        if not config.IS_RASPBERRY_PI:
             cv2.destroyAllWindows()
 
         audio.stop()
@@ -234,12 +500,17 @@ def main():
                 "Total_Time": face_tracking[fid]["total_time"]
             })
 
-        save_report(session_records,
-                    script_dir,
-                    campaign_duration,
-                    campaign_start_dt)
-
-        plot_graph(time_axis, timeline, script_dir)
+        try:
+            save_report(session_records,
+                        script_dir,
+                        campaign_duration,
+                        campaign_start_dt)
+        finally:
+            timeline.close()
+            try:
+                plot_graph(timeline.path, campaign_start_dt, script_dir)
+            finally:
+                os.remove(timeline.path)
 
 
 # ------------------ CSV ------------------
@@ -256,7 +527,14 @@ def save_report(session_records,
     csv_path = os.path.join(results_dir,
                             f"attention_report_{timestamp}.csv")
 
-    total_attention = sum(s["Attention_Time"] for s in session_records)
+    # Attention/total seconds as one (N,2) array: summed and rounded vectorised
+    n = len(session_records)
+    times = np.fromiter(
+        (v for s in session_records for v in (s["Attention_Time"], s["Total_Time"])),
+        np.float64, count=2 * n
+    ).reshape(n, 2)
+
+    total_attention = float(times[:, 0].sum())
     unique_people = len(set(s["Face_ID"] for s in session_records))
     avg_attention = total_attention / unique_people if unique_people > 0 else 0
 
@@ -267,14 +545,14 @@ def save_report(session_records,
         writer.writerow([])
         writer.writerow(["Face_ID","Start_Time","End_Time","Attention_Time_s","Total_Time_s"])
 
-        for s in session_records:
-            writer.writerow([
-                s["Face_ID"],
-                s["Start_Time"].strftime("%H:%M:%S"),
-                s["End_Time"].strftime("%H:%M:%S"),
-                round(s["Attention_Time"],2),
-                round(s["Total_Time"],2)
-            ])
+        writer.writerows(
+            [s["Face_ID"],
+             s["Start_Time"].strftime("%H:%M:%S"),
+             s["End_Time"].strftime("%H:%M:%S"),
+             attention,
+             total]
+            for s, (attention, total) in zip(session_records, np.round(times, 2).tolist())
+        )
 
         writer.writerow([])
         writer.writerow(["Summary"])
@@ -289,13 +567,27 @@ def save_report(session_records,
 # ------------------ GRAPH ------------------
 
 
-def plot_graph(time_axis, timeline, script_dir):
+def plot_graph(timeline_path, campaign_start_dt, script_dir):
 
     results_dir = os.path.join(script_dir,"Human_proximity_Results")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    if os.path.getsize(timeline_path):
+        data = np.memmap(timeline_path, dtype=TIMELINE_DTYPE, mode="r")
+    else:
+        data = np.zeros(0, TIMELINE_DTYPE)
+
+    # Reduce to at most MAX_PLOT_POINTS buckets, keeping each bucket's peak count
+    step = max(1, -(-len(data) // MAX_PLOT_POINTS))
+    starts = np.arange(0, len(data), step)
+    t = data["t"][starts]
+    counts = np.maximum.reduceat(data["n"], starts) if len(data) else data["n"]
+    # float64 before adding: float32 days since the epoch only resolve ~3 minutes
+    clock = mdates.date2num(campaign_start_dt) + t.astype(np.float64) / 86400.0
+    del data
+
     plt.figure()
-    plt.plot(time_axis, timeline)
+    plt.plot(clock, counts)
     plt.xlabel("Clock Time")
     plt.ylabel("Number of People")
     plt.title("People vs Time")
@@ -0,0 +1,60 @@
+"""
+ONNX Runtime session helper shared by main.py and the Old_code pipeline.
+
+Every SCRFD / ArcFace session is built here so thread counts, spinning and
+graph optimisation are tuned in one place.
+"""
+
+import os
+
+import onnxruntime as ort
+
+import config
+
+# OpenVINO when the installed onnxruntime build has it, CPU otherwise
+DEFAULT_PROVIDERS = ("OpenVINOExecutionProvider", "CPUExecutionProvider")
+
+# Old_code pipeline: prefer CUDA; HEURISTIC conv algo search avoids the long
+# EXHAUSTIVE cuDNN benchmark on the first frames.
+CUDA_PROVIDERS = (
+    ("CUDAExecutionProvider", {"cudnn_conv_algo_search": "HEURISTIC"}),
+    "CPUExecutionProvider",
+)
+
+
+def session_options():
+    """
+    ONNX Runtime session options tuned for edge CPUs.
+
+    Full graph optimisation, one intra-op pool (4 threads on the Pi, half the
+    cores elsewhere), no inter-op parallelism and no spin-waiting so idle
+    threads don't burn CPU.
+
+    Returns:
+        ort.SessionOptions: Options for SCRFD and ArcFace sessions
+    """
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    so.intra_op_num_threads = 4 if config.IS_RASPBERRY_PI else max(1, (os.cpu_count() or 2) // 2)
+    so.inter_op_num_threads = 1
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    return so
+
+
+def create_session(model_path, providers=DEFAULT_PROVIDERS):
+    """
+    Create an InferenceSession with `session_options()`.
+
+    Args:
+        model_path (str): Path to the ONNX model
+        providers: Execution providers in order of preference; names or
+            (name, options) tuples. Ones missing from this build are skipped.
+
+    Returns:
+        ort.InferenceSession: The session
+    """
+    available = ort.get_available_providers()
+    providers = [p for p in providers
+                 if (p[0] if isinstance(p, tuple) else p) in available]
+    return ort.InferenceSession(model_path, session_options(), providers=providers)
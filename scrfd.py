@@ -1,6 +1,30 @@
 import numpy as np
 import cv2
-from pprint import pprint
+
+
+def _nms(boxes, scores, iou_thr=0.4):
+    """Greedy NMS on (N,4) x1,y1,x2,y2 boxes; returns kept indices, best score first."""
+    x1, y1, x2, y2 = boxes[:,0], boxes[:,1], boxes[:,2], boxes[:,3]
+    areas = (x2 - x1) * (y2 - y1)
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+
+        xx1 = np.maximum(x1[i], x1[rest])
+        yy1 = np.maximum(y1[i], y1[rest])
+        xx2 = np.minimum(x2[i], x2[rest])
+        yy2 = np.minimum(y2[i], y2[rest])
+        inter = np.maximum(0, xx2-xx1) * np.maximum(0, yy2-yy1)
+        iou = inter / (areas[i] + areas[rest] - inter)
+
+        order = rest[iou <= iou_thr]
+
+    return np.array(keep, dtype=int)
+
 
 class SCRFD:
     def __init__(self, session):
@@ -16,6 +40,21 @@ class SCRFD:
             self.anchor_cache[s] = self._anchors(s)
 
         self.input_name = session.get_inputs()[0].name
+        self.output_names = [o.name for o in session.get_outputs()]
+
+        # outputs are bound once to preallocated arrays (after the first run reveals their shapes)
+        self._binding = None
+        self._outputs = None
+
+        # letterbox canvas reused every frame; padding only re-zeroed when the frame size changes
+        self._canvas = np.zeros((self.input_size, self.input_size, 3), np.uint8)
+        self._placement = None
+
+        # anchors mapped back to frame coordinates, rebuilt only when the letterbox changes
+        self._decode_key = None
+        self._anchor_decoded = {}
+        self._offset = None
+        self._inv_scale = None
 
     def _anchors(self, stride):
         f = self.input_size // stride
@@ -26,26 +65,56 @@ class SCRFD:
         anchors = np.repeat(anchors, 2, axis=0)
         return anchors.astype(np.float32)
 
+    def _update_decode(self, scale, left, top):
+        key = (scale, left, top)
+        if key == self._decode_key:
+            return
+        offset = np.array([left, top], np.float32)
+        for s in self.strides:
+            self._anchor_decoded[s] = (self.anchor_cache[s] - offset) / scale
+        self._offset = offset
+        self._inv_scale = np.float32(1.0 / scale)
+        self._decode_key = key
+
+    def _run(self, blob):
+        if self._outputs is None:
+            outs = self.session.run(None, {self.input_name: blob})
+            self._outputs = [np.empty_like(o) for o in outs]
+            self._binding = self.session.io_binding()
+            for name, buf in zip(self.output_names, self._outputs):
+                self._binding.bind_output(name, "cpu", 0, buf.dtype.type,
+                                          list(buf.shape), buf.ctypes.data)
+            return outs
+
+        self._binding.bind_cpu_input(self.input_name, blob)
+        self.session.run_with_iobinding(self._binding)
+        return self._outputs
+
     def preprocess(self, img):
         h, w = img.shape[:2]
         scale = self.input_size / max(h, w)
         nh, nw = int(h*scale), int(w*scale)
 
-        img = cv2.resize(img, (nw, nh))
-        canvas = np.zeros((self.input_size, self.input_size, 3), np.uint8)
         top = (self.input_size-nh)//2
         left = (self.input_size-nw)//2
-        canvas[top:top+nh, left:left+nw] = img
-
-        canvas = cv2.cvtColor(canvas, cv2.COLOR_BGR2RGB)
-        canvas = (canvas - self.mean) / self.std
-        blob = canvas.transpose(2,0,1)[None].astype(np.float32)
+        if self._placement != (nh, nw):
+            self._canvas[:] = 0
+            self._placement = (nh, nw)
+        # resize straight into the canvas region (a strided view; no temporary image)
+        cv2.resize(img, (nw, nh), dst=self._canvas[top:top+nh, left:left+nw])
+
+        # mean-sub + scale + BGR->RGB + HWC->NCHW in a single OpenCV pass
+        blob = cv2.dnn.blobFromImage(
+            self._canvas, 1.0/self.std, (self.input_size, self.input_size),
+            (self.mean, self.mean, self.mean), swapRB=True, crop=False
+        )
 
         return blob, scale, left, top
 
     def detect(self, img, thresh=0.6):
         blob, scale, left, top = self.preprocess(img)
-        outs = self.session.run(None, {self.input_name: blob})
+        self._update_decode(scale, left, top)
+        outs = self._run(blob)
 
         boxes_all, scores_all, kps_all = [], [], []
 
@@ -56,21 +125,18 @@ class SCRFD:
             if not mask.any():
                 continue
 
-            anchors = self.anchor_cache[stride][mask]
+            anchors = self._anchor_decoded[stride][mask]
             box = box.reshape(-1,4)[mask]
             kps = kps.reshape(-1,10)[mask]
 
-            cx, cy = anchors[:,0], anchors[:,1]
-            x1 = (cx - box[:,0]*stride - left) / scale
-            y1 = (cy - box[:,1]*stride - top) / scale
-            x2 = (cx + box[:,2]*stride - left) / scale
-            y2 = (cy + box[:,3]*stride - top) / scale
-
-            boxes = np.stack([x1,y1,x2,y2],1)
+            # x1 = (cx - d*stride - left)/scale == cx_frame - d*(stride/scale), all in-place
+            boxes = np.multiply(box, stride * self._inv_scale, out=box)
+            np.subtract(anchors, boxes[:,0:2], out=boxes[:,0:2])
+            np.add(anchors, boxes[:,2:4], out=boxes[:,2:4])
 
             lm = kps.reshape(-1,5,2)
-            lm[:,:,0] = (lm[:,:,0]-left)/scale
-            lm[:,:,1] = (lm[:,:,1]-top)/scale
+            np.subtract(lm, self._offset, out=lm)
+            lm *= self._inv_scale
 
             boxes_all.append(boxes)
             scores_all.append(scores[mask])
@@ -83,12 +149,5 @@ class SCRFD:
         scores = np.concatenate(scores_all)
         kps = np.concatenate(kps_all)
 
-        keep = cv2.dnn.NMSBoxes(
-            boxes.tolist(), scores.tolist(), 0.6, 0.4
-        )
-
-        if len(keep)==0:
-            return [], []
-
-        keep = np.array(keep).flatten()
+        keep = _nms(boxes, scores, 0.4)
         return boxes[keep].astype(int).tolist(), kps[keep]